@@ -3,67 +3,186 @@ app.py - Main Flask application for the ATS Resume Checker.
 Serves the frontend and exposes API endpoints for resume analysis.
 """
 
+import gzip
+import logging
 import os
 import time
-from flask import Flask, request, jsonify, send_from_directory, make_response
+from functools import wraps
+from io import BytesIO
+from flask import Flask, Request, request, jsonify, make_response
+from flask.json.provider import JSONProvider
 from parsers import extract_text
 from ats_checker import analyze_resume
 from job_matcher import compare_cv_to_job
 
+try:
+    import orjson
+except ImportError:  # optional; Flask's stdlib json provider is used instead
+    orjson = None
+
+logging.basicConfig(level=os.environ.get('LOG_LEVEL', 'INFO').upper())
+log = logging.getLogger(__name__)
+
+
+class InMemoryUploadRequest(Request):
+    """Request that keeps uploaded files in memory instead of spooling them to disk."""
+
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        # Safe because MAX_CONTENT_LENGTH bounds the size of the whole request.
+        return BytesIO()
+
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider backed by orjson, which serializes the analysis dicts much faster."""
+
+    # Sorted keys match the output of Flask's default provider
+    options = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS if orjson else 0
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=self.options).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # Hand orjson's bytes straight to the response, skipping a decode/encode round trip
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj, option=self.options), mimetype='application/json')
+
+
 app = Flask(__name__, static_folder='static')
+app.request_class = InMemoryUploadRequest
+if orjson is not None:
+    app.json = OrjsonProvider(app)
 
 # Ensure uploads directory exists
 UPLOAD_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'uploads')
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 
 ALLOWED_EXTENSIONS = {'pdf', 'docx', 'doc', 'txt', 'rtf', 'html', 'htm'}
+_ALLOWED_SUFFIXES = frozenset('.' + ext for ext in ALLOWED_EXTENSIONS)
 MAX_FILE_SIZE = 10 * 1024 * 1024  # 10 MB
+FILE_TOO_LARGE_ERROR = f'File is too large. Maximum size is {MAX_FILE_SIZE // (1024 * 1024)} MB.'
+PREVIEW_LENGTH = 300  # characters of extracted text echoed back to the client
+COMPRESS_MIN_SIZE = 1024  # bytes; smaller JSON bodies are sent uncompressed
+COMPRESS_LEVEL = 5
+# Resume plus an optional job description file, each up to MAX_FILE_SIZE, plus
+# headroom for multipart boundaries, part headers and the pasted job_description
+# field (Flask caps form fields at 500 KB)
+REQUEST_OVERHEAD = 1024 * 1024
+app.config['MAX_CONTENT_LENGTH'] = 2 * MAX_FILE_SIZE + REQUEST_OVERHEAD
+# Let browsers reuse index.html and static assets for a few minutes before
+# revalidating; matches the 'expires 5m' in the README's nginx example
+STATIC_MAX_AGE = 300  # seconds
+app.config['SEND_FILE_MAX_AGE_DEFAULT'] = STATIC_MAX_AGE
 
 
 def _allowed_file(filename):
-    return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
+    # splitext treats dotfiles such as '.pdf' as having no extension
+    return os.path.splitext(filename)[1].lower() in _ALLOWED_SUFFIXES
+
+
+def _text_preview(text):
+    """Return the start of the text for display, marking it with '...' if truncated."""
+    if len(text) > PREVIEW_LENGTH:
+        return text[:PREVIEW_LENGTH] + '...'
+    return text
+
+
+def _read_upload(file):
+    """Read an uploaded file into memory. Returns None if it exceeds MAX_FILE_SIZE."""
+    file.stream.seek(0)
+    raw_bytes = file.read(MAX_FILE_SIZE + 1)
+    if len(raw_bytes) > MAX_FILE_SIZE:
+        return None
+    return raw_bytes
+
+
+def require_resume(view):
+    """
+    Validate the 'resume' upload before running the view.
+
+    Rejects missing, unnamed, unsupported, and oversize files with the JSON error
+    shape used by the API; otherwise calls the view with the FileStorage and its
+    contents read into memory.
+    """
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        file = request.files.get('resume')
+        if file is None:
+            return jsonify({'error': 'No resume file uploaded. Please upload a file.'}), 400
+
+        if file.filename == '':
+            return jsonify({'error': 'No file selected.'}), 400
+
+        if not _allowed_file(file.filename):
+            return jsonify({
+                'error': f'Unsupported file type. Allowed: {", ".join(sorted(ALLOWED_EXTENSIONS))}'
+            }), 400
+
+        raw_bytes = _read_upload(file)
+        if raw_bytes is None:
+            return jsonify({'error': FILE_TOO_LARGE_ERROR}), 413
+
+        return view(file, raw_bytes, *args, **kwargs)
+    return wrapper
+
+
+def _extract(raw_bytes, filename):
+    """Extract text from raw upload bytes (cached by content hash in parsers)."""
+    return extract_text(BytesIO(raw_bytes), filename=filename)
 
 
 # ──────────────────────────────────────────────
 # Routes
 # ──────────────────────────────────────────────
 
+@app.errorhandler(413)
+def request_too_large(e):
+    """Reject oversize uploads as soon as the request headers are seen."""
+    return jsonify({'error': FILE_TOO_LARGE_ERROR}), 413
+
+
+@app.after_request
+def compress_response(resp):
+    """Gzip JSON responses for clients that accept it."""
+    if resp.mimetype != 'application/json' or resp.direct_passthrough or 'Content-Encoding' in resp.headers:
+        return resp
+
+    resp.vary.add('Accept-Encoding')
+    if not request.accept_encodings['gzip']:
+        return resp
+
+    data = resp.get_data()
+    if len(data) >= COMPRESS_MIN_SIZE:
+        resp.set_data(gzip.compress(data, compresslevel=COMPRESS_LEVEL))
+        resp.headers['Content-Encoding'] = 'gzip'
+    return resp
+
+
 @app.route('/')
 def index():
-    """Serve the main HTML page."""
-    return send_from_directory('static', 'index.html')
+    """Serve the main HTML page with a short Cache-Control max-age."""
+    return app.send_static_file('index.html')
 
 
 @app.route('/api/analyze', methods=['POST'])
-def analyze():
+@require_resume
+def analyze(file, raw_bytes):
     """
     Analyze an uploaded resume for ATS compatibility.
     
     Expects: multipart/form-data with a 'resume' file field.
     Returns: JSON with overall score and per-section breakdowns.
     """
-    if 'resume' not in request.files:
-        return jsonify({'error': 'No resume file uploaded. Please upload a file.'}), 400
-
-    file = request.files['resume']
-    if file.filename == '':
-        return jsonify({'error': 'No file selected.'}), 400
-
-    if not _allowed_file(file.filename):
-        return jsonify({
-            'error': f'Unsupported file type. Allowed: {", ".join(ALLOWED_EXTENSIONS)}'
-        }), 400
-
     try:
-        # Reset file stream to beginning to ensure we read the full content
-        file.stream.seek(0)
-
-        # Parse the file
-        result = extract_text(file, filename=file.filename)
+        # Parse the file (cached by content hash)
+        result = _extract(raw_bytes, file.filename)
         text = result['text']
+        words = text.split()
+        word_count = len(words)
 
-        print(f"[ANALYZE] File: {file.filename}, Extracted {len(text)} chars, {len(text.split())} words")
-        print(f"[ANALYZE] Preview: {text[:200]}...")
+        log.debug("[ANALYZE] File: %s, Extracted %d chars, %d words", file.filename, len(text), word_count)
 
         if not text or len(text.strip()) < 20:
             return jsonify({
@@ -72,16 +191,16 @@ def analyze():
             }), 400
 
         # Run ATS analysis
-        analysis = analyze_resume(text, metadata=result.get('metadata', {}))
+        analysis = analyze_resume(text, metadata=result.get('metadata', {}), words=words)
         analysis['file_info'] = {
             'filename': file.filename,
             'format': result['format'],
             'text_length': len(text),
-            'word_count': len(text.split()),
+            'word_count': word_count,
         }
         # Include text preview so user can verify correct file was parsed
-        analysis['text_preview'] = text[:300] + ('...' if len(text) > 300 else '')
-        analysis['timestamp'] = time.time()
+        analysis['text_preview'] = _text_preview(text)
+        analysis['timestamp'] = time.time_ns() // 1_000_000  # epoch milliseconds
 
         resp = make_response(jsonify(analysis))
         resp.headers['Cache-Control'] = 'no-cache, no-store, must-revalidate'
@@ -92,13 +211,13 @@ def analyze():
     except ValueError as e:
         return jsonify({'error': str(e)}), 400
     except Exception as e:
-        import traceback
-        traceback.print_exc()
+        log.exception("[ANALYZE] Failed to analyze %s", file.filename)
         return jsonify({'error': f'An error occurred while analyzing the file: {str(e)}'}), 500
 
 
 @app.route('/api/compare', methods=['POST'])
-def compare():
+@require_resume
+def compare(file, raw_bytes):
     """
     Compare a resume against a job description.
     
@@ -107,20 +226,16 @@ def compare():
         - 'job_description': either a file or text field
     Returns: JSON with match score, pros, cons, and recommendations.
     """
-    if 'resume' not in request.files:
-        return jsonify({'error': 'No resume file uploaded.'}), 400
-
-    file = request.files['resume']
-    if file.filename == '' or not _allowed_file(file.filename):
-        return jsonify({'error': 'Invalid or unsupported resume file.'}), 400
-
     # Get job description (either as file or text)
     job_text = None
     if 'job_description_file' in request.files:
         jd_file = request.files['job_description_file']
         if jd_file.filename:
+            jd_bytes = _read_upload(jd_file)
+            if jd_bytes is None:
+                return jsonify({'error': FILE_TOO_LARGE_ERROR}), 413
             try:
-                jd_result = extract_text(jd_file, filename=jd_file.filename)
+                jd_result = _extract(jd_bytes, jd_file.filename)
                 job_text = jd_result['text']
             except Exception:
                 pass
@@ -135,25 +250,24 @@ def compare():
         }), 400
 
     try:
-        # Reset file stream to beginning
-        file.stream.seek(0)
-
-        # Parse resume
-        result = extract_text(file, filename=file.filename)
+        # Parse resume (cached by content hash)
+        result = _extract(raw_bytes, file.filename)
         cv_text = result['text']
 
-        print(f"[COMPARE] File: {file.filename}, Extracted {len(cv_text)} chars")
+        log.debug("[COMPARE] File: %s, Extracted %d chars", file.filename, len(cv_text))
 
         if not cv_text or len(cv_text.strip()) < 20:
             return jsonify({
                 'error': 'Could not extract meaningful text from the resume file.'
             }), 400
 
-        # Run ATS analysis on the resume as well
-        ats_analysis = analyze_resume(cv_text, metadata=result.get('metadata', {}))
+        # Run ATS analysis on the resume as well, sharing the split and lowercased text
+        words = cv_text.split()
+        cv_lower = cv_text.lower()
+        ats_analysis = analyze_resume(cv_text, metadata=result.get('metadata', {}), words=words, text_lower=cv_lower)
 
         # Compare CV to job description
-        comparison = compare_cv_to_job(cv_text, job_text)
+        comparison = compare_cv_to_job(cv_text, job_text, cv_lower=cv_lower)
 
         # Combine results
         response = {
@@ -162,10 +276,10 @@ def compare():
             'file_info': {
                 'filename': file.filename,
                 'format': result['format'],
-                'word_count': len(cv_text.split()),
+                'word_count': len(words),
             },
-            'text_preview': cv_text[:300] + ('...' if len(cv_text) > 300 else ''),
-            'timestamp': time.time(),
+            'text_preview': _text_preview(cv_text),
+            'timestamp': time.time_ns() // 1_000_000,
         }
 
         resp = make_response(jsonify(response))
@@ -177,8 +291,7 @@ def compare():
     except ValueError as e:
         return jsonify({'error': str(e)}), 400
     except Exception as e:
-        import traceback
-        traceback.print_exc()
+        log.exception("[COMPARE] Failed to compare %s", file.filename)
         return jsonify({'error': f'An error occurred: {str(e)}'}), 500
 
 
@@ -188,4 +301,4 @@ def compare():
 
 if __name__ == '__main__':
     port = int(os.environ.get('PORT', 5000))
-    app.run(host='0.0.0.0', port=port, debug=True)
+    app.run(host='0.0.0.0', port=port, debug=os.environ.get('FLASK_DEBUG') == '1')
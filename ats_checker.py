@@ -3,8 +3,10 @@ ats_checker.py - ATS (Applicant Tracking System) analysis engine.
 Provides 6 scoring modules that evaluate a resume against ATS standards.
 """
 
+import os
 import re
-from collections import Counter
+
+from term_scanner import TermScanner
 
 
 # ──────────────────────────────────────────────
@@ -55,7 +57,7 @@ SOFT_SKILLS = {
     'work ethic', 'verbal communication', 'written communication',
 }
 
-STANDARD_SECTIONS = {
+STANDARD_SECTIONS = frozenset({
     'work experience', 'experience', 'professional experience', 'employment history',
     'employment', 'career history',
     'education', 'academic background', 'academic', 'qualifications',
@@ -70,7 +72,16 @@ STANDARD_SECTIONS = {
     'languages',
     'publications',
     'contact', 'contact information', 'personal information', 'personal details',
-}
+})
+
+# Lines longer than this (after stripping) can never be a standard heading
+_MAX_SECTION_LENGTH = max(len(s) for s in STANDARD_SECTIONS)
+
+EXPERIENCE_SECTIONS = frozenset({
+    'experience', 'work experience', 'professional experience', 'employment history', 'employment',
+})
+EDUCATION_SECTIONS = frozenset({'education', 'academic background', 'qualifications'})
+SKILLS_SECTIONS = frozenset({'skills', 'technical skills', 'core competencies', 'competencies', 'key skills'})
 
 DEGREE_LEVELS = {
     'phd': 5, 'ph.d': 5, 'doctorate': 5, 'doctoral': 5,
@@ -112,14 +123,100 @@ ACTION_VERBS = [
     'trained', 'transformed', 'upgraded',
 ]
 
+TITLE_KEYWORDS = [
+    'manager', 'director', 'engineer', 'developer', 'analyst', 'specialist',
+    'coordinator', 'consultant', 'administrator', 'architect', 'designer',
+    'lead', 'senior', 'junior', 'intern', 'associate', 'vice president', 'vp',
+    'chief', 'ceo', 'cto', 'cfo', 'coo', 'president', 'founder', 'co-founder',
+    'supervisor', 'technician', 'officer', 'executive', 'head of', 'team lead',
+]
+
+INSTITUTION_KEYWORDS = ['university', 'college', 'institute', 'school', 'academy', 'polytechnic']
+
+BUZZWORDS = [
+    'synergy', 'paradigm', 'leverage', 'utilize', 'facilitate', 'ecosystem',
+    'disrupt', 'bandwidth', 'touchpoint', 'circle back', 'deep dive',
+    'move the needle', 'low-hanging fruit', 'best of breed',
+]
+
+# Every keyword database in one scanner, so analyze_resume finds them all in a single pass
+_TERM_SCANNER = TermScanner({
+    'hard': HARD_SKILLS,
+    'soft': SOFT_SKILLS,
+    'title': TITLE_KEYWORDS,
+    'degree': DEGREE_LEVELS,
+    'cert': CERTIFICATIONS_DB,
+    'institution': INSTITUTION_KEYWORDS,
+    'verb': ACTION_VERBS,
+    'buzz': BUZZWORDS,
+})
+
+
+# ──────────────────────────────────────────────
+# Precompiled patterns
+# ──────────────────────────────────────────────
+
+_MONTH = (r'(?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?|Aug(?:ust)?'
+          r'|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)')
+
+_SPECIAL_CHARS_RE = re.compile(r'[│┃┆┇┊┋╎╏║╟╢╫╬▶►▸▹◆◇○●■□★☆♦♣♠♥→←↑↓⇒⇐]')
+
+_EMAIL_RE = re.compile(r'[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}')
+# Every match starts with a digit, '(' or '+'; the lookahead rejects other positions
+# before the nested optional groups are tried
+_PHONE_RE = re.compile(r'(?=[\d(+])(?:\+?\d{1,3}[\s\-.]?)?\(?\d{2,4}\)?[\s\-.]?\d{3,4}[\s\-.]?\d{3,4}')
+_LINKEDIN_RE = re.compile(r'linkedin\.com/in/[\w\-]+', re.IGNORECASE)
+_LOCATION_RES = [
+    re.compile(r'\b\d{5}(?:-\d{4})?\b'),  # ZIP code
+    re.compile(r'\b[A-Z][a-z]+,\s*[A-Z]{2}\b'),  # City, ST
+    re.compile(r'\b[A-Z][a-z]+,\s*[A-Z][a-z]+\b'),  # City, Country
+]
+
+# Date ranges, e.g. "Jan 2020 - Present", "03/2019 – 06/2021", "2018 - 2022".
+# Kept as separate patterns: their match counts are summed, and a month range
+# deliberately also counts as a year range, which one fused alternation would not do.
+# The leading lookahead rejects positions that cannot start a month name before
+# the regex engine tries all twelve alternatives there.
+_DATE_RANGE_RES = [
+    re.compile(r'(?=[adfjmnos])' + _MONTH + r'\s*\.?\s*\d{4}\s*[-–—to]+\s*(?:' + _MONTH + r'\s*\.?\s*\d{4}|[Pp]resent|[Cc]urrent)',
+               re.IGNORECASE),
+    re.compile(r'\d{1,2}/\d{4}\s*[-–—to]+\s*(?:\d{1,2}/\d{4}|[Pp]resent|[Cc]urrent)', re.IGNORECASE),
+    re.compile(r'\d{4}\s*[-–—to]+\s*(?:\d{4}|[Pp]resent|[Cc]urrent)', re.IGNORECASE),
+]
+# Leading \b moved into a lookbehind after the literal century, so the engine can
+# jump straight to candidate '19'/'20' positions instead of testing every boundary
+_YEAR_RE = re.compile(r'(?:19|20)(?<!\w..)\d{2}\b')
+_QUANTIFIED_RE = re.compile(
+    r'\d+%|\$[\d,]+|\d+\+?\s*(?:year|month|client|customer|user|project|team|member|employee)', re.IGNORECASE
+)
+
+_GPA_RE = re.compile(r'(?:gpa|grade|cgpa)[\s:]*(\d\.\d+)')
+
+# Matched against lowercased text
+_RESULT_RES = [
+    re.compile(r'(?:increased|decreased|reduced|improved|grew|boosted|cut|saved|generated|delivered|achieved)\s+.*?\d+'),
+    re.compile(r'\d+%\s+(?:increase|decrease|improvement|growth|reduction)'),
+    re.compile(r'\$[\d,.]+\s*(?:million|billion|k|m|b|revenue|savings|budget)'),
+    re.compile(r'\d+\s*(?:clients|customers|users|projects|products|teams)'),
+]
+_PRONOUN_RE = re.compile(r'\b(?=[Im])(?:I|me|my|myself)\b')
+_BULLET_CHARS = frozenset('•-*▪▸►')
+
 
 # ──────────────────────────────────────────────
 # Main analysis function
 # ──────────────────────────────────────────────
 
-def analyze_resume(text, metadata=None):
+def analyze_resume(text, metadata=None, words=None, text_lower=None):
     """
     Run all 6 ATS analysis modules on the resume text.
+
+    Args:
+        text: extracted resume text.
+        metadata: structural info from parsers.extract_text.
+        words: optional precomputed text.split() result, to avoid splitting twice
+            when the caller already has it.
+        text_lower: optional precomputed text.lower() result, likewise.
     
     Returns:
         dict with:
@@ -128,14 +225,21 @@ def analyze_resume(text, metadata=None):
     """
     if metadata is None:
         metadata = {}
+    if words is None:
+        words = text.split()
+    # Lowercased once and shared by every module that matches keywords
+    if text_lower is None:
+        text_lower = text.lower()
+    hits = _TERM_SCANNER.scan(text_lower)
+    found_sections, bullet_lines = _scan_lines(text)
 
     sections = [
-        _analyze_keywords(text),
-        _analyze_formatting(text, metadata),
+        _analyze_keywords(hits),
+        _analyze_formatting(text, metadata, words, found_sections),
         _analyze_contact_info(text),
-        _analyze_experience(text),
-        _analyze_education(text),
-        _analyze_semantic(text),
+        _analyze_experience(text, hits),
+        _analyze_education(text_lower, hits),
+        _analyze_semantic(text, text_lower, hits, bullet_lines),
     ]
 
     # Weighted average: keywords and experience weigh more
@@ -149,15 +253,83 @@ def analyze_resume(text, metadata=None):
     }
 
 
+def analyze_resumes(texts, metadatas=None, max_workers=1):
+    """
+    Run analyze_resume over a batch of resumes.
+
+    The keyword scanner and regexes are built once at import and shared by the
+    whole batch. The analysis is CPU-bound Python, so parallelism comes from
+    worker processes rather than threads.
+
+    Args:
+        texts: iterable of extracted resume texts.
+        metadatas: optional iterable of metadata dicts, one per text.
+        max_workers: number of worker processes; 1 analyzes in this process,
+            None uses one per CPU.
+
+    Returns:
+        list of analyze_resume results, in the order of texts.
+    """
+    texts = list(texts)
+    metadatas = [None] * len(texts) if metadatas is None else list(metadatas)
+    if len(metadatas) != len(texts):
+        raise ValueError('metadatas must have one entry per text')
+
+    if max_workers == 1 or len(texts) <= 1:
+        return [analyze_resume(text, metadata) for text, metadata in zip(texts, metadatas)]
+
+    # Imported here: multiprocessing costs more to import than the rest of this module
+    from concurrent.futures import ProcessPoolExecutor
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    # Chunk the work so each worker round trip covers several resumes
+    chunksize = max(1, len(texts) // (4 * max_workers))
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(analyze_resume, texts, metadatas, chunksize=chunksize))
+
+
+def _scan_lines(text):
+    """
+    Walk the resume once line by line.
+
+    Returns:
+        (found_sections, bullet_lines): the standard section headings found,
+        lowercased, and the number of lines starting with a bullet character
+        followed by whitespace.
+    """
+    found_sections = []
+    bullet_lines = 0
+    lines = text.split('\n')
+    last = len(lines) - 1
+
+    for n, line in enumerate(lines):
+        lstripped = line.lstrip()
+
+        # A bullet ending its line is followed by the newline, unless it ends the text
+        if lstripped[:1] in _BULLET_CHARS:
+            after = lstripped[1:2]
+            if after.isspace() or (not after and n < last):
+                bullet_lines += 1
+
+        stripped = lstripped.rstrip().rstrip(':')
+        # Lowercasing never shortens a string, so long lines can be skipped unlowered
+        if len(stripped) <= _MAX_SECTION_LENGTH:
+            stripped = stripped.lower()
+            if stripped in STANDARD_SECTIONS:
+                found_sections.append(stripped)
+
+    return found_sections, bullet_lines
+
+
 # ──────────────────────────────────────────────
 # 1. Keyword Matching
 # ──────────────────────────────────────────────
 
-def _analyze_keywords(text):
-    text_lower = text.lower()
-    
-    found_hard = [s for s in HARD_SKILLS if s in text_lower]
-    found_soft = [s for s in SOFT_SKILLS if s in text_lower]
+def _analyze_keywords(hits):
+    # Sorted once here for both the findings and the details
+    found_hard = sorted(hits['hard'])
+    found_soft = sorted(hits['soft'])
     
     # Score based on number of skills found
     hard_score = min(len(found_hard) / 8 * 100, 100)  # 8+ hard skills = 100
@@ -168,12 +340,12 @@ def _analyze_keywords(text):
 
     findings = []
     if found_hard:
-        findings.append(f"Found {len(found_hard)} hard skill(s): {', '.join(sorted(found_hard)[:15])}")
+        findings.append(f"Found {len(found_hard)} hard skill(s): {', '.join(found_hard[:15])}")
     else:
         findings.append("No recognizable hard skills found. Add specific tools, technologies, and methodologies.")
     
     if found_soft:
-        findings.append(f"Found {len(found_soft)} soft skill(s): {', '.join(sorted(found_soft)[:10])}")
+        findings.append(f"Found {len(found_soft)} soft skill(s): {', '.join(found_soft[:10])}")
     else:
         findings.append("No soft skills detected. Consider adding communication, leadership, or teamwork keywords.")
 
@@ -190,8 +362,8 @@ def _analyze_keywords(text):
         'findings': findings,
         'recommendations': recommendations,
         'details': {
-            'hard_skills': sorted(found_hard),
-            'soft_skills': sorted(found_soft),
+            'hard_skills': found_hard,
+            'soft_skills': found_soft,
             'hard_count': len(found_hard),
             'soft_count': len(found_soft),
         }
@@ -202,27 +374,15 @@ def _analyze_keywords(text):
 # 2. Formatting & Parseability
 # ──────────────────────────────────────────────
 
-def _analyze_formatting(text, metadata):
+def _analyze_formatting(text, metadata, words, found_sections):
     score = 100
     findings = []
     recommendations = []
 
     # Check for standard section headings
-    lines = text.split('\n')
-    found_sections = []
-    for line in lines:
-        stripped = line.strip().lower().rstrip(':')
-        if stripped in STANDARD_SECTIONS:
-            found_sections.append(stripped)
-
-    essential_sections = ['experience', 'work experience', 'professional experience', 'employment history', 'employment']
-    has_experience = any(s in found_sections for s in essential_sections)
-    
-    education_sections = ['education', 'academic background', 'qualifications']
-    has_education = any(s in found_sections for s in education_sections)
-    
-    skills_sections = ['skills', 'technical skills', 'core competencies', 'competencies', 'key skills']
-    has_skills = any(s in found_sections for s in skills_sections)
+    has_experience = not EXPERIENCE_SECTIONS.isdisjoint(found_sections)
+    has_education = not EDUCATION_SECTIONS.isdisjoint(found_sections)
+    has_skills = not SKILLS_SECTIONS.isdisjoint(found_sections)
 
     if has_experience:
         findings.append("✅ Work Experience section found")
@@ -246,7 +406,7 @@ def _analyze_formatting(text, metadata):
         score -= 15
 
     # Check for overly short resume
-    word_count = len(text.split())
+    word_count = len(words)
     if word_count < 100:
         findings.append(f"⚠️ Resume is very short ({word_count} words)")
         recommendations.append("Your resume seems too brief. Aim for at least 300-600 words.")
@@ -259,7 +419,8 @@ def _analyze_formatting(text, metadata):
         findings.append(f"✅ Good length ({word_count} words)")
 
     # Check for special characters that may confuse parsers
-    special_chars = len(re.findall(r'[│┃┆┇┊┋╎╏║╟╢╫╬▶►▸▹◆◇○●■□★☆♦♣♠♥→←↑↓⇒⇐]', text))
+    # Every decorative character is non-ASCII, so plain ASCII text can skip the scan
+    special_chars = 0 if text.isascii() else len(_SPECIAL_CHARS_RE.findall(text))
     if special_chars > 5:
         findings.append(f"⚠️ Found {special_chars} special/decorative characters")
         recommendations.append("Remove decorative symbols and special characters that may confuse ATS parsers.")
@@ -299,7 +460,7 @@ def _analyze_contact_info(text):
     details = {}
 
     # Email
-    email_match = re.search(r'[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}', text)
+    email_match = _EMAIL_RE.search(text)
     if email_match:
         details['email'] = email_match.group()
         findings.append(f"✅ Email found: {email_match.group()}")
@@ -309,9 +470,7 @@ def _analyze_contact_info(text):
         recommendations.append("Add your professional email address.")
 
     # Phone
-    phone_match = re.search(
-        r'(?:\+?\d{1,3}[\s\-.]?)?\(?\d{2,4}\)?[\s\-.]?\d{3,4}[\s\-.]?\d{3,4}', text
-    )
+    phone_match = _PHONE_RE.search(text)
     if phone_match:
         details['phone'] = phone_match.group().strip()
         findings.append(f"✅ Phone number found: {phone_match.group().strip()}")
@@ -321,7 +480,7 @@ def _analyze_contact_info(text):
         recommendations.append("Add your phone number with country code.")
 
     # LinkedIn
-    linkedin_match = re.search(r'linkedin\.com/in/[\w\-]+', text, re.IGNORECASE)
+    linkedin_match = _LINKEDIN_RE.search(text)
     if linkedin_match:
         details['linkedin'] = linkedin_match.group()
         findings.append(f"✅ LinkedIn profile found")
@@ -347,13 +506,8 @@ def _analyze_contact_info(text):
             score += 5
 
     # Location
-    location_patterns = [
-        r'\b\d{5}(?:-\d{4})?\b',  # ZIP code
-        r'\b[A-Z][a-z]+,\s*[A-Z]{2}\b',  # City, ST
-        r'\b[A-Z][a-z]+,\s*[A-Z][a-z]+\b',  # City, Country
-    ]
-    for pattern in location_patterns:
-        loc_match = re.search(pattern, text)
+    for pattern in _LOCATION_RES:
+        loc_match = pattern.search(text)
         if loc_match:
             details['location'] = loc_match.group()
             findings.append(f"✅ Location/address info found")
@@ -377,23 +531,16 @@ def _analyze_contact_info(text):
 # 4. Work Experience & Longevity
 # ──────────────────────────────────────────────
 
-def _analyze_experience(text):
+def _analyze_experience(text, hits):
     score = 0
     findings = []
     recommendations = []
     details = {}
 
     # Find date ranges (e.g., "Jan 2020 - Present", "2018 - 2022", "03/2019 – 06/2021")
-    date_patterns = [
-        r'(?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?|Aug(?:ust)?|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)\s*\.?\s*\d{4}\s*[-–—to]+\s*(?:(?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?|Aug(?:ust)?|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)\s*\.?\s*\d{4}|[Pp]resent|[Cc]urrent)',
-        r'\d{1,2}/\d{4}\s*[-–—to]+\s*(?:\d{1,2}/\d{4}|[Pp]resent|[Cc]urrent)',
-        r'\d{4}\s*[-–—to]+\s*(?:\d{4}|[Pp]resent|[Cc]urrent)',
-    ]
-
     all_dates = []
-    for pattern in date_patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE)
-        all_dates.extend(matches)
+    for pattern in _DATE_RANGE_RES:
+        all_dates.extend(pattern.findall(text))
 
     if all_dates:
         findings.append(f"✅ Found {len(all_dates)} date range(s) in work history")
@@ -404,9 +551,9 @@ def _analyze_experience(text):
         recommendations.append("Include clear start and end dates for each role (e.g., 'Jan 2020 - Present').")
 
     # Calculate approximate years of experience
-    years = re.findall(r'\b((?:19|20)\d{2})\b', text)
+    years = _YEAR_RE.findall(text)
     if years:
-        years_int = [int(y) for y in years]
+        years_int = list(map(int, years))
         min_year = min(years_int)
         max_year = max(years_int)
         exp_years = max_year - min_year
@@ -428,15 +575,7 @@ def _analyze_experience(text):
         score += 5
 
     # Job title detection
-    title_keywords = [
-        'manager', 'director', 'engineer', 'developer', 'analyst', 'specialist',
-        'coordinator', 'consultant', 'administrator', 'architect', 'designer',
-        'lead', 'senior', 'junior', 'intern', 'associate', 'vice president', 'vp',
-        'chief', 'ceo', 'cto', 'cfo', 'coo', 'president', 'founder', 'co-founder',
-        'supervisor', 'technician', 'officer', 'executive', 'head of', 'team lead',
-    ]
-    text_lower = text.lower()
-    found_titles = [t for t in title_keywords if t in text_lower]
+    found_titles = hits['title']
     if found_titles:
         findings.append(f"✅ Job title keywords detected: {', '.join(found_titles[:8])}")
         score += 15
@@ -447,8 +586,7 @@ def _analyze_experience(text):
         score += 5
 
     # Check for quantified achievements
-    quant_pattern = r'\d+%|\$[\d,]+|\d+\+?\s*(?:year|month|client|customer|user|project|team|member|employee)'
-    quantified = re.findall(quant_pattern, text, re.IGNORECASE)
+    quantified = _QUANTIFIED_RE.findall(text)
     if quantified:
         findings.append(f"✅ {len(quantified)} quantified achievement(s) found")
         score += 20
@@ -471,39 +609,30 @@ def _analyze_experience(text):
 # 5. Education & Certifications
 # ──────────────────────────────────────────────
 
-def _analyze_education(text):
+def _analyze_education(text_lower, hits):
     score = 0
     findings = []
     recommendations = []
     details = {}
 
-    text_lower = text.lower()
-
     # Degree detection
-    found_degrees = []
-    max_degree_level = 0
-    for keyword, level in DEGREE_LEVELS.items():
-        if keyword in text_lower:
-            found_degrees.append(keyword)
-            max_degree_level = max(max_degree_level, level)
+    found_degrees = hits['degree']
+    max_degree_level = max((DEGREE_LEVELS[keyword] for keyword in found_degrees), default=0)
 
     if found_degrees:
         level_names = {1: 'Diploma/Certificate', 2: 'Associate', 3: 'Bachelor', 4: 'Master', 5: 'Doctorate'}
         findings.append(f"✅ Highest education level detected: {level_names.get(max_degree_level, 'Unknown')}")
-        findings.append(f"   Degree keywords found: {', '.join(set(found_degrees))}")
+        findings.append(f"   Degree keywords found: {', '.join(found_degrees)}")
         score += 40
         details['degree_level'] = max_degree_level
-        details['degree_keywords'] = list(set(found_degrees))
+        details['degree_keywords'] = found_degrees
     else:
         findings.append("⚠️ No degree keywords detected")
         recommendations.append("Include your degree type (e.g., 'Bachelor of Science', 'MBA').")
         details['degree_level'] = 0
 
     # Certification detection
-    found_certs = []
-    for cert in CERTIFICATIONS_DB:
-        if cert.lower() in text_lower:
-            found_certs.append(cert)
+    found_certs = hits['cert']
 
     if found_certs:
         findings.append(f"✅ {len(found_certs)} certification(s) detected: {', '.join(found_certs[:8])}")
@@ -515,8 +644,7 @@ def _analyze_education(text):
         score += 10  # not always required
 
     # University / institution name check
-    university_keywords = ['university', 'college', 'institute', 'school', 'academy', 'polytechnic']
-    has_institution = any(kw in text_lower for kw in university_keywords)
+    has_institution = bool(hits['institution'])
     if has_institution:
         findings.append("✅ Educational institution name found")
         score += 15
@@ -525,7 +653,7 @@ def _analyze_education(text):
         recommendations.append("Include the name of your university or college.")
 
     # GPA mention
-    gpa_match = re.search(r'(?:gpa|grade|cgpa)[\s:]*(\d\.\d+)', text_lower)
+    gpa_match = _GPA_RE.search(text_lower)
     if gpa_match:
         findings.append(f"ℹ️ GPA mentioned: {gpa_match.group(1)}")
         score += 10
@@ -545,17 +673,14 @@ def _analyze_education(text):
 # 6. Semantic / Contextual Analysis
 # ──────────────────────────────────────────────
 
-def _analyze_semantic(text):
+def _analyze_semantic(text, text_lower, hits, bullet_lines):
     score = 0
     findings = []
     recommendations = []
     details = {}
 
-    text_lower = text.lower()
-    words = text_lower.split()
-
     # Action verbs
-    found_verbs = [v for v in ACTION_VERBS if v in text_lower]
+    found_verbs = hits['verb']
     if len(found_verbs) >= 8:
         findings.append(f"✅ Strong use of action verbs ({len(found_verbs)} found)")
         score += 30
@@ -572,16 +697,9 @@ def _analyze_semantic(text):
     details['action_verbs'] = sorted(found_verbs)
 
     # Quantified results (more thorough check)
-    result_patterns = [
-        r'(?:increased|decreased|reduced|improved|grew|boosted|cut|saved|generated|delivered|achieved)\s+.*?\d+',
-        r'\d+%\s+(?:increase|decrease|improvement|growth|reduction)',
-        r'\$[\d,.]+\s*(?:million|billion|k|m|b|revenue|savings|budget)',
-        r'\d+\s*(?:clients|customers|users|projects|products|teams)',
-    ]
     contextual_results = []
-    for pattern in result_patterns:
-        matches = re.findall(pattern, text_lower)
-        contextual_results.extend(matches)
+    for pattern in _RESULT_RES:
+        contextual_results.extend(pattern.findall(text_lower))
 
     if contextual_results:
         findings.append(f"✅ {len(contextual_results)} contextual achievement(s) with metrics found")
@@ -592,7 +710,7 @@ def _analyze_semantic(text):
         recommendations.append("Provide context for your skills: 'Increased sales by 20%' instead of just listing 'Sales'.")
 
     # First-person pronoun check (ATS best practice: avoid "I", "me", "my")
-    pronoun_count = len(re.findall(r'\b(?:I|me|my|myself)\b', text))
+    pronoun_count = len(_PRONOUN_RE.findall(text))
     if pronoun_count == 0:
         findings.append("✅ No first-person pronouns (good ATS practice)")
         score += 15
@@ -605,10 +723,7 @@ def _analyze_semantic(text):
         recommendations.append("Remove first-person pronouns. Instead of 'I managed a team', write 'Managed a team of...'")
 
     # Buzzword density check
-    buzzwords = ['synergy', 'paradigm', 'leverage', 'utilize', 'facilitate', 'ecosystem',
-                 'disrupt', 'bandwidth', 'touchpoint', 'circle back', 'deep dive',
-                 'move the needle', 'low-hanging fruit', 'best of breed']
-    found_buzz = [b for b in buzzwords if b in text_lower]
+    found_buzz = hits['buzz']
     if found_buzz:
         findings.append(f"⚠️ {len(found_buzz)} corporate buzzword(s) detected: {', '.join(found_buzz)}")
         recommendations.append("Replace vague buzzwords with specific, measurable language.")
@@ -618,7 +733,6 @@ def _analyze_semantic(text):
         score += 15
 
     # Consistency check: bullet points
-    bullet_lines = len(re.findall(r'^[\s]*[•\-\*▪▸►]\s', text, re.MULTILINE))
     if bullet_lines >= 5:
         findings.append(f"✅ Good use of bullet points ({bullet_lines} found)")
         score += 10
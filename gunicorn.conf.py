@@ -0,0 +1,20 @@
+"""
+gunicorn.conf.py - Production server settings, picked up automatically by `gunicorn app:app`.
+Every value can be overridden on the command line or through the environment.
+"""
+
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 5000)}"
+
+# Pre-forked worker processes, each with a few threads so slow uploads
+# and file parsing on one request don't block the rest of the worker.
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', 4))
+
+# Import the app before forking so workers share its memory copy-on-write
+preload_app = True
+
+timeout = 60
@@ -5,11 +5,21 @@ Identifies matching qualifications (pros), gaps (cons), and actionable recommend
 
 import re
 from collections import Counter
+from heapq import nsmallest
 
+from ats_checker import _YEAR_RE
+from term_scanner import TermScanner
 
-def compare_cv_to_job(cv_text, job_text):
+
+def compare_cv_to_job(cv_text, job_text, cv_lower=None):
     """
     Compare CV text against a job description.
+
+    Args:
+        cv_text: extracted CV text.
+        job_text: job description text.
+        cv_lower: optional precomputed cv_text.lower() result, to avoid
+            lowercasing the CV twice when the caller already has it.
     
     Returns:
         dict with:
@@ -19,16 +29,44 @@ def compare_cv_to_job(cv_text, job_text):
             - recommendations: actionable suggestions
             - keyword_analysis: detailed keyword comparison
     """
-    cv_lower = cv_text.lower()
+    return _compare(_featurize_cv(cv_text, cv_lower), job_text)
+
+
+def compare_cv_to_jobs(cv_text, job_texts, cv_lower=None):
+    """
+    Compare one CV against several job descriptions.
+
+    The CV's skills, keywords, experience and degree level are extracted once
+    and reused for every job description.
+
+    Returns:
+        list of compare_cv_to_job results, in the order of job_texts.
+    """
+    cv_features = _featurize_cv(cv_text, cv_lower)
+    return [_compare(cv_features, job_text) for job_text in job_texts]
+
+
+def _featurize_cv(cv_text, cv_lower=None):
+    """Extract the CV-side features that compare_cv_to_job matches against."""
+    if cv_lower is None:
+        cv_lower = cv_text.lower()
+    return (
+        _extract_skills_from_text(cv_lower),
+        _extract_important_keywords(cv_lower),
+        _estimate_cv_years(cv_lower),
+        _get_cv_degree_level(cv_lower),
+    )
+
+
+def _compare(cv_features, job_text):
+    cv_skills, cv_keywords, cv_years, cv_degree = cv_features
     job_lower = job_text.lower()
 
     # Extract key terms from job description
     job_skills = _extract_skills_from_text(job_lower)
-    cv_skills = _extract_skills_from_text(cv_lower)
 
     job_requirements = _extract_requirements(job_lower)
     job_keywords = _extract_important_keywords(job_lower)
-    cv_keywords = _extract_important_keywords(cv_lower)
 
     # ── Matching analysis ──
     matched_skills = job_skills & cv_skills
@@ -38,6 +76,13 @@ def compare_cv_to_job(cv_text, job_text):
     matched_keywords = job_keywords & cv_keywords
     missing_keywords = job_keywords - cv_keywords
 
+    # Skill lists are reported in full, so sort them once; only the first few
+    # missing keywords are shown, so those are selected without a full sort
+    sorted_matched = sorted(matched_skills)
+    sorted_missing = sorted(missing_skills)
+    sorted_extra = sorted(extra_skills)
+    top_missing = nsmallest(8, missing_keywords)
+
     # ── Score calculation ──
     if len(job_skills) > 0:
         skill_match_pct = len(matched_skills) / len(job_skills) * 100
@@ -55,13 +100,12 @@ def compare_cv_to_job(cv_text, job_text):
     # ── Build pros ──
     pros = []
     if matched_skills:
-        pros.append(f"Your CV matches {len(matched_skills)} required skill(s): {', '.join(sorted(matched_skills)[:12])}")
+        pros.append(f"Your CV matches {len(matched_skills)} required skill(s): {', '.join(sorted_matched[:12])}")
     if matched_keywords:
         pros.append(f"{len(matched_keywords)} job keyword(s) found in your CV")
 
     # Check for experience level match
     job_years = _extract_years_requirement(job_lower)
-    cv_years = _estimate_cv_years(cv_lower)
     if job_years and cv_years:
         if cv_years >= job_years:
             pros.append(f"Your experience (~{cv_years} years) meets the {job_years}+ year requirement")
@@ -70,20 +114,18 @@ def compare_cv_to_job(cv_text, job_text):
 
     # Check for degree match
     job_degree = _extract_degree_requirement(job_lower)
-    cv_degree = _get_cv_degree_level(cv_lower)
     if job_degree and cv_degree >= job_degree:
         degree_names = {1: 'Diploma', 2: 'Associate', 3: "Bachelor's", 4: "Master's", 5: 'Doctorate'}
         pros.append(f"Your education level ({degree_names.get(cv_degree, 'Unknown')}) meets the requirement")
 
     if extra_skills:
-        pros.append(f"Additional skills you bring: {', '.join(sorted(extra_skills)[:8])}")
+        pros.append(f"Additional skills you bring: {', '.join(sorted_extra[:8])}")
 
     # ── Build cons ──
     cons = []
     if missing_skills:
-        cons.append(f"Missing {len(missing_skills)} required skill(s): {', '.join(sorted(missing_skills)[:12])}")
+        cons.append(f"Missing {len(missing_skills)} required skill(s): {', '.join(sorted_missing[:12])}")
     if missing_keywords:
-        top_missing = sorted(missing_keywords)[:8]
         cons.append(f"Missing key terms from job description: {', '.join(top_missing)}")
 
     if job_years and cv_years and cv_years < job_years:
@@ -99,13 +141,13 @@ def compare_cv_to_job(cv_text, job_text):
         recommendations.append({
             'action': 'add',
             'priority': 'high',
-            'text': f"Add these skills to your CV if you have them: {', '.join(sorted(missing_skills)[:10])}",
+            'text': f"Add these skills to your CV if you have them: {', '.join(sorted_missing[:10])}",
         })
     if missing_keywords:
         recommendations.append({
             'action': 'add',
             'priority': 'medium',
-            'text': f"Incorporate these keywords naturally into your CV: {', '.join(sorted(missing_keywords)[:8])}",
+            'text': f"Incorporate these keywords naturally into your CV: {', '.join(top_missing)}",
         })
     if extra_skills and len(extra_skills) > 10:
         recommendations.append({
@@ -143,9 +185,9 @@ def compare_cv_to_job(cv_text, job_text):
         'keyword_analysis': {
             'job_skills': sorted(job_skills),
             'cv_skills': sorted(cv_skills),
-            'matched_skills': sorted(matched_skills),
-            'missing_skills': sorted(missing_skills),
-            'extra_skills': sorted(extra_skills),
+            'matched_skills': sorted_matched,
+            'missing_skills': sorted_missing,
+            'extra_skills': sorted_extra,
             'job_keywords_count': len(job_keywords),
             'matched_keywords_count': len(matched_keywords),
         }
@@ -186,61 +228,63 @@ SKILL_DB = {
     'critical thinking', 'time management', 'collaboration', 'negotiation',
 }
 
+_SKILL_SCANNER = TermScanner({'skill': sorted(SKILL_DB)})
+
+# Common words ignored when extracting job description keywords
+STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'from', 'is', 'are', 'was', 'were', 'be', 'been',
+    'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
+    'could', 'should', 'may', 'might', 'shall', 'can', 'need', 'must',
+    'this', 'that', 'these', 'those', 'it', 'its', 'we', 'our', 'you',
+    'your', 'they', 'their', 'he', 'she', 'him', 'her', 'who', 'which',
+    'what', 'when', 'where', 'how', 'why', 'all', 'each', 'every', 'both',
+    'few', 'more', 'most', 'other', 'some', 'such', 'no', 'not', 'only',
+    'same', 'so', 'than', 'too', 'very', 'just', 'about', 'above', 'also',
+    'as', 'if', 'then', 'up', 'out', 'into', 'over', 'after', 'before',
+    'between', 'under', 'again', 'further', 'once', 'here', 'there',
+    'any', 'able', 'work', 'working', 'experience', 'including',
+    'within', 'across', 'well', 'role', 'position', 'candidate',
+    'required', 'preferred', 'minimum', 'strong', 'excellent',
+    'ability', 'skills', 'knowledge', 'requirements', 'qualifications',
+    'responsibilities', 'duties', 'looking', 'seeking', 'join',
+})
+
+# Precompiled patterns
+# Keywords are words of four or more letters
+_WORD_RE = re.compile(r'\b[a-z]{4,}\b')
+_REQUIREMENTS_RES = [
+    re.compile(r'(?:requirements?|qualifications?|must have|required|what you.?ll need)[\s:]*\n((?:.*\n)*?)\n\n',
+               re.IGNORECASE),
+]
+_YEARS_REQUIREMENT_RES = [
+    re.compile(r'(\d+)\+?\s*years?\s*(?:of\s+)?(?:experience|exp)'),
+    re.compile(r'(?:minimum|at least|min)\s*(\d+)\s*years?'),
+    re.compile(r'(\d+)\+?\s*years?\s*(?:in|of|with)'),
+]
+
 
 def _extract_skills_from_text(text):
-    """Extract known skills mentioned in text."""
-    found = set()
-    for skill in SKILL_DB:
-        if skill in text:
-            found.add(skill)
-    return found
+    """Extract known skills mentioned in lowercased text."""
+    return set(_SKILL_SCANNER.scan(text)['skill'])
 
 
 def _extract_important_keywords(text):
-    """Extract important multi-word and single-word keywords from text."""
-    # Remove common stop words and extract meaningful terms
-    stop_words = {
-        'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-        'of', 'with', 'by', 'from', 'is', 'are', 'was', 'were', 'be', 'been',
-        'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
-        'could', 'should', 'may', 'might', 'shall', 'can', 'need', 'must',
-        'this', 'that', 'these', 'those', 'it', 'its', 'we', 'our', 'you',
-        'your', 'they', 'their', 'he', 'she', 'him', 'her', 'who', 'which',
-        'what', 'when', 'where', 'how', 'why', 'all', 'each', 'every', 'both',
-        'few', 'more', 'most', 'other', 'some', 'such', 'no', 'not', 'only',
-        'same', 'so', 'than', 'too', 'very', 'just', 'about', 'above', 'also',
-        'as', 'if', 'then', 'up', 'out', 'into', 'over', 'after', 'before',
-        'between', 'under', 'again', 'further', 'once', 'here', 'there',
-        'any', 'able', 'work', 'working', 'experience', 'including',
-        'within', 'across', 'well', 'role', 'position', 'candidate',
-        'required', 'preferred', 'minimum', 'strong', 'excellent',
-        'ability', 'skills', 'knowledge', 'requirements', 'qualifications',
-        'responsibilities', 'duties', 'looking', 'seeking', 'join',
-    }
-    
-    words = re.findall(r'\b[a-z]{3,}\b', text)
-    keywords = set()
-    for word in words:
-        if word not in stop_words and len(word) > 3:
-            keywords.add(word)
+    """Extract important multi-word and single-word keywords from lowercased text."""
+    # Stop words are dropped before counting so the Counter only holds candidates
+    word_counts = Counter([w for w in _WORD_RE.findall(text) if w not in STOP_WORDS])
 
     # Only keep words that appear meaningfully (not extremely common)
-    word_counts = Counter(words)
-    significant = {w for w, c in word_counts.items() if 1 <= c <= 20 and w not in stop_words and len(w) > 3}
-    
-    return significant
+    return {w for w, c in word_counts.items() if c <= 20}
 
 
 def _extract_requirements(text):
-    """Extract specific requirements from a job description."""
+    """Extract specific requirements from a lowercased job description."""
     requirements = []
     
     # Look for lines after "requirements", "qualifications", etc.
-    req_patterns = [
-        r'(?:requirements?|qualifications?|must have|required|what you.?ll need)[\s:]*\n((?:.*\n)*?)\n\n',
-    ]
-    for pattern in req_patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE)
+    for pattern in _REQUIREMENTS_RES:
+        matches = pattern.findall(text)
         for m in matches:
             lines = [l.strip().lstrip('•-*▪ ') for l in m.split('\n') if l.strip()]
             requirements.extend(lines)
@@ -249,54 +293,50 @@ def _extract_requirements(text):
 
 
 def _extract_years_requirement(text):
-    """Extract years-of-experience requirement from job description."""
-    patterns = [
-        r'(\d+)\+?\s*years?\s*(?:of\s+)?(?:experience|exp)',
-        r'(?:minimum|at least|min)\s*(\d+)\s*years?',
-        r'(\d+)\+?\s*years?\s*(?:in|of|with)',
-    ]
-    for pattern in patterns:
-        match = re.search(pattern, text)
+    """Extract years-of-experience requirement from a lowercased job description."""
+    for pattern in _YEARS_REQUIREMENT_RES:
+        match = pattern.search(text)
         if match:
             return int(match.group(1))
     return None
 
 
 def _estimate_cv_years(text):
-    """Estimate years of experience from CV."""
-    years = re.findall(r'\b((?:19|20)\d{2})\b', text)
+    """Estimate years of experience from lowercased CV text."""
+    years = _YEAR_RE.findall(text)
     if len(years) >= 2:
         years_int = [int(y) for y in years]
         return max(years_int) - min(years_int)
     return None
 
 
+JOB_DEGREE_LEVELS = {
+    'phd': 5, 'ph.d': 5, 'doctorate': 5, 'doctoral': 5,
+    'master': 4, 'masters': 4, "master's": 4, 'mba': 4,
+    'bachelor': 3, 'bachelors': 3, "bachelor's": 3,
+    'associate': 2,
+    'diploma': 1,
+}
+
+CV_DEGREE_LEVELS = {
+    'phd': 5, 'ph.d': 5, 'doctorate': 5,
+    'master': 4, 'masters': 4, "master's": 4, 'mba': 4, 'msc': 4,
+    'bachelor': 3, 'bachelors': 3, "bachelor's": 3, 'bsc': 3, 'b.s': 3,
+    'associate': 2,
+    'diploma': 1, 'certificate': 1,
+}
+
+_JOB_DEGREE_SCANNER = TermScanner({'degree': JOB_DEGREE_LEVELS})
+_CV_DEGREE_SCANNER = TermScanner({'degree': CV_DEGREE_LEVELS})
+
+
 def _extract_degree_requirement(text):
-    """Extract minimum degree requirement from job description."""
-    degree_map = {
-        'phd': 5, 'ph.d': 5, 'doctorate': 5, 'doctoral': 5,
-        'master': 4, 'masters': 4, "master's": 4, 'mba': 4,
-        'bachelor': 3, 'bachelors': 3, "bachelor's": 3,
-        'associate': 2,
-        'diploma': 1,
-    }
-    for keyword, level in sorted(degree_map.items(), key=lambda x: -x[1]):
-        if keyword in text:
-            return level
-    return None
+    """Extract minimum degree requirement from a lowercased job description."""
+    found = _JOB_DEGREE_SCANNER.scan(text)['degree']
+    return max((JOB_DEGREE_LEVELS[keyword] for keyword in found), default=None)
 
 
 def _get_cv_degree_level(text):
-    """Get highest degree level from CV."""
-    degree_map = {
-        'phd': 5, 'ph.d': 5, 'doctorate': 5,
-        'master': 4, 'masters': 4, "master's": 4, 'mba': 4, 'msc': 4,
-        'bachelor': 3, 'bachelors': 3, "bachelor's": 3, 'bsc': 3, 'b.s': 3,
-        'associate': 2,
-        'diploma': 1, 'certificate': 1,
-    }
-    max_level = 0
-    for keyword, level in degree_map.items():
-        if keyword in text:
-            max_level = max(max_level, level)
-    return max_level
+    """Get highest degree level from lowercased CV text."""
+    found = _CV_DEGREE_SCANNER.scan(text)['degree']
+    return max((CV_DEGREE_LEVELS[keyword] for keyword in found), default=0)
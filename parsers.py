@@ -3,10 +3,65 @@ parsers.py - Multi-format file-to-text extraction module.
 Supports PDF, DOCX, TXT, RTF, and HTML files.
 """
 
+import hashlib
 import os
 import re
+import sys
+import threading
+from collections import OrderedDict
 from io import BytesIO
 
+# Format libraries are imported once here rather than on every parse. Each is
+# optional: without it, uploads of that format are rejected with a ValueError.
+try:
+    from PyPDF2 import PdfReader
+except ImportError:
+    PdfReader = None
+try:
+    from docx import Document
+except ImportError:
+    Document = None
+try:
+    from striprtf.striprtf import rtf_to_text
+except ImportError:
+    rtf_to_text = None
+try:
+    from bs4 import BeautifulSoup
+except ImportError:
+    BeautifulSoup = None
+
+# Parsed files are kept in memory, keyed by content hash. Besides the entry count,
+# the cache is bounded by the estimated size of what it holds: a single 10 MB
+# upload can parse into a text plus heading list of around a gigabyte, and every
+# Gunicorn worker has its own cache. Bounding it also limits how much of other
+# users' resume text outlives their request.
+PARSE_CACHE_SIZE = 128
+PARSE_CACHE_MAX_BYTES = 64 * 1024 * 1024  # estimated total size of all cached results
+PARSE_CACHE_ENTRY_MAX_BYTES = 2 * 1024 * 1024  # larger results are returned but not cached
+_HEADING_COST = 256  # approximate bytes held by one headings_found dict
+
+_parse_cache = OrderedDict()  # key -> (result, estimated size)
+_parse_cache_bytes = 0
+_parse_cache_lock = threading.Lock()
+
+_LINE_ENDING_RE = re.compile(r'\r\n?')
+_BLANK_LINES_RE = re.compile(r'\n{3,}')
+
+# Headings _extract_structure recognises as standard resume sections
+STANDARD_HEADINGS = frozenset([
+    'work experience', 'experience', 'professional experience', 'employment history',
+    'education', 'academic background', 'qualifications',
+    'skills', 'technical skills', 'core competencies', 'competencies',
+    'certifications', 'certificates', 'licenses',
+    'summary', 'professional summary', 'objective', 'career objective', 'profile',
+    'projects', 'portfolio',
+    'awards', 'honors', 'achievements',
+    'references', 'volunteer', 'volunteering', 'languages',
+    'publications', 'interests', 'hobbies',
+    'contact', 'contact information', 'personal information',
+])
+_MAX_HEADING_LENGTH = 40  # lines this long or longer are never treated as headings
+
 
 def extract_text(file_storage, filename=None):
     """
@@ -21,6 +76,10 @@ def extract_text(file_storage, filename=None):
             - text: extracted plain text
             - format: detected file format
             - metadata: dict with structural info (headings found, etc.)
+
+    Users commonly re-upload the same CV against several job descriptions, so
+    results are cached keyed by a hash of the file contents and its extension.
+    The returned dict may be shared between callers and must not be mutated.
     """
     if filename is None:
         filename = getattr(file_storage, 'filename', 'unknown.txt')
@@ -48,57 +107,92 @@ def extract_text(file_storage, filename=None):
         file_storage.stream.seek(0)
 
     raw_bytes = file_storage.read()
+    key = (hashlib.blake2b(raw_bytes, digest_size=16).digest(), ext)
+
+    with _parse_cache_lock:
+        entry = _parse_cache.get(key)
+        if entry is not None:
+            _parse_cache.move_to_end(key)
+            return entry[0]
+
     text = parser(raw_bytes)
     text = _clean_text(text)
     metadata = _extract_structure(text)
 
-    return {
+    result = {
         'text': text,
         'format': ext.lstrip('.'),
         'metadata': metadata,
     }
 
+    _cache_result(key, result)
+    return result
+
+
+def _cache_result(key, result):
+    """Store a parse result, evicting the oldest entries to stay within the cache limits."""
+    global _parse_cache_bytes
+
+    size = sys.getsizeof(result['text']) + _HEADING_COST * len(result['metadata']['headings_found'])
+    if size > PARSE_CACHE_ENTRY_MAX_BYTES:
+        return
+
+    with _parse_cache_lock:
+        # Another request may have cached the same file while this one was parsing
+        previous = _parse_cache.pop(key, None)
+        if previous is not None:
+            _parse_cache_bytes -= previous[1]
+
+        _parse_cache[key] = (result, size)
+        _parse_cache_bytes += size
+        while len(_parse_cache) > PARSE_CACHE_SIZE or _parse_cache_bytes > PARSE_CACHE_MAX_BYTES:
+            _, (_, evicted_size) = _parse_cache.popitem(last=False)
+            _parse_cache_bytes -= evicted_size
+
+
+def _require(library, package):
+    """Raise a ValueError if the optional parser library for a format is missing."""
+    if library is None:
+        raise ValueError(f"This file format requires the '{package}' package, which is not installed.")
+
 
 def _parse_pdf(raw_bytes):
     """Extract text from PDF bytes."""
-    from PyPDF2 import PdfReader
+    _require(PdfReader, 'PyPDF2')
     reader = PdfReader(BytesIO(raw_bytes))
-    pages = []
-    for page in reader.pages:
-        page_text = page.extract_text()
-        if page_text:
-            pages.append(page_text)
-    return '\n'.join(pages)
+    # Pages without extractable text are skipped
+    return '\n'.join(filter(None, (page.extract_text() for page in reader.pages)))
 
 
 def _parse_docx(raw_bytes):
     """Extract text from DOCX bytes."""
-    from docx import Document
+    _require(Document, 'python-docx')
     doc = Document(BytesIO(raw_bytes))
-    paragraphs = [p.text for p in doc.paragraphs]
-    return '\n'.join(paragraphs)
+    return '\n'.join(p.text for p in doc.paragraphs)
 
 
 def _parse_txt(raw_bytes):
     """Extract text from plain text bytes."""
-    for encoding in ('utf-8', 'utf-8-sig', 'latin-1', 'cp1252'):
+    # utf-8-sig decodes plain UTF-8 too, dropping a leading byte order mark if present
+    for encoding in ('utf-8-sig', 'cp1252'):
         try:
             return raw_bytes.decode(encoding)
-        except (UnicodeDecodeError, AttributeError):
+        except UnicodeDecodeError:
             continue
-    return raw_bytes.decode('utf-8', errors='replace')
+    # latin-1 maps every byte, so this cannot fail
+    return raw_bytes.decode('latin-1')
 
 
 def _parse_rtf(raw_bytes):
     """Extract text from RTF bytes."""
-    from striprtf.striprtf import rtf_to_text
+    _require(rtf_to_text, 'striprtf')
     rtf_content = raw_bytes.decode('utf-8', errors='replace')
     return rtf_to_text(rtf_content)
 
 
 def _parse_html(raw_bytes):
     """Extract text from HTML bytes."""
-    from bs4 import BeautifulSoup
+    _require(BeautifulSoup, 'beautifulsoup4')
     html_content = raw_bytes.decode('utf-8', errors='replace')
     soup = BeautifulSoup(html_content, 'html.parser')
     # Remove script and style elements
@@ -109,10 +203,11 @@ def _parse_html(raw_bytes):
 
 def _clean_text(text):
     """Clean extracted text: normalize whitespace, remove excessive blank lines."""
-    # Normalize line endings
-    text = text.replace('\r\n', '\n').replace('\r', '\n')
+    # Normalize line endings (most extracted text has no carriage returns at all)
+    if '\r' in text:
+        text = _LINE_ENDING_RE.sub('\n', text)
     # Remove excessive blank lines (more than 2 consecutive)
-    text = re.sub(r'\n{3,}', '\n\n', text)
+    text = _BLANK_LINES_RE.sub('\n\n', text)
     # Strip leading/trailing whitespace
     text = text.strip()
     return text
@@ -124,35 +219,29 @@ def _extract_structure(text):
     Returns info about detected headings, sections, etc.
     """
     lines = text.split('\n')
-    
-    standard_headings = [
-        'work experience', 'experience', 'professional experience', 'employment history',
-        'education', 'academic background', 'qualifications',
-        'skills', 'technical skills', 'core competencies', 'competencies',
-        'certifications', 'certificates', 'licenses',
-        'summary', 'professional summary', 'objective', 'career objective', 'profile',
-        'projects', 'portfolio',
-        'awards', 'honors', 'achievements',
-        'references', 'volunteer', 'volunteering', 'languages',
-        'publications', 'interests', 'hobbies',
-        'contact', 'contact information', 'personal information',
-    ]
-    
+
     found_headings = []
-    for i, line in enumerate(lines):
-        stripped = line.strip().lower().rstrip(':')
-        if stripped in standard_headings:
+    for i, line in enumerate(lines, 1):
+        line_text = line.strip()
+        stripped = line_text.rstrip(':')
+        # Lowercasing never shortens a string, so lines too long to be headings
+        # are skipped before paying for lower()
+        if len(stripped) >= _MAX_HEADING_LENGTH:
+            continue
+        stripped = stripped.lower()
+        if stripped in STANDARD_HEADINGS:
             found_headings.append({
-                'text': line.strip(),
-                'line': i + 1,
+                'text': line_text,
+                'line': i,
                 'standard': True,
             })
-        elif len(stripped) > 0 and len(stripped) < 40 and stripped == stripped.upper() and not stripped.isdigit():
+        elif len(stripped) > 0 and len(stripped) < _MAX_HEADING_LENGTH and stripped == stripped.upper() and not stripped.isdigit():
             # Potential all-caps heading
             found_headings.append({
-                'text': line.strip(),
-                'line': i + 1,
-                'standard': stripped.lower().rstrip(':') in standard_headings,
+                'text': line_text,
+                'line': i,
+                # stripped is already lowercased and not a standard heading (checked above)
+                'standard': False,
             })
 
     return {
@@ -0,0 +1,57 @@
+"""
+term_scanner.py - Multi-term substring matching for the keyword databases.
+Finds every known term in a text in a single pass with an Aho-Corasick automaton
+(pyahocorasick), falling back to one substring check per term when it is not installed.
+"""
+
+try:
+    import ahocorasick
+except ImportError:  # optional; fall back to plain substring checks
+    ahocorasick = None
+
+
+class TermScanner:
+    """
+    Finds which terms from fixed groups of keywords occur in a text.
+
+    A term counts as found exactly when `term in text` would be true, so the
+    automaton and the fallback give identical results.
+
+    Args:
+        groups: dict mapping a group name to an iterable of terms.
+                A term may belong to more than one group.
+    """
+
+    def __init__(self, groups):
+        # Flat vocabulary with every distinct term once; groups refer to it by index
+        self.terms = tuple(dict.fromkeys(term for terms in groups.values() for term in terms))
+        index = {term: i for i, term in enumerate(self.terms)}
+        self.groups = {name: tuple(index[term] for term in terms) for name, terms in groups.items()}
+        self._automaton = None
+
+        if ahocorasick is not None:
+            automaton = ahocorasick.Automaton()
+            for i, term in enumerate(self.terms):
+                automaton.add_word(term, i)
+            automaton.make_automaton()
+            self._automaton = automaton
+
+    def scan(self, text):
+        """
+        Scan text for all terms at once.
+
+        Returns:
+            dict mapping each group name to the list of its terms found in text,
+            in the order the terms were given.
+        """
+        found = bytearray(len(self.terms))
+        if self._automaton is None:
+            for i, term in enumerate(self.terms):
+                if term in text:
+                    found[i] = 1
+        else:
+            for _, i in self._automaton.iter(text):
+                found[i] = 1
+
+        terms = self.terms
+        return {name: [terms[i] for i in indexes if found[i]] for name, indexes in self.groups.items()}